@@ -6,12 +6,14 @@ from specparam.core.strings import (gen_settings_str, gen_model_results_str,
                                     gen_group_results_str, gen_time_results_str,
                                     gen_event_results_str)
 from specparam.data.utils import get_periodic_labels
-from specparam.plts.templates import plot_text
+from specparam.plts.settings import PLT_TEXT_FONT
 from specparam.plts.group import (plot_group_aperiodic, plot_group_goodness,
                                   plot_group_peak_frequencies)
 
 plt = safe_import('.pyplot', 'matplotlib')
 gridspec = safe_import('.gridspec', 'matplotlib')
+mfigure = safe_import('.figure', 'matplotlib')
+backend_pdf = safe_import('.backends.backend_pdf', 'matplotlib')
 
 ###################################################################################################
 ###################################################################################################
@@ -19,12 +21,17 @@ gridspec = safe_import('.gridspec', 'matplotlib')
 ## Settings & Globals
 REPORT_FIGSIZE = (16, 20)
 SAVE_FORMAT = 'pdf'
+REPORT_DPI = 150
+
+# Cache for a figure object, which is re-used across reports
+_REPORT_FIG = {'fig' : None}
 
 ###################################################################################################
 ###################################################################################################
 
 @check_dependency(plt, 'matplotlib')
-def save_model_report(model, file_name, file_path=None, add_settings=True, **plot_kwargs):
+def save_model_report(model, file_name, file_path=None, add_settings=True,
+                      add_results_text=True, **plot_kwargs):
     """Generate and save out a PDF report for a power spectrum model fit.
 
     Parameters
@@ -37,36 +44,64 @@ def save_model_report(model, file_name, file_path=None, add_settings=True, **plo
         Path to directory to save to. If None, saves to current directory.
     add_settings : bool, optional, default: True
         Whether to add a print out of the model settings to the end of the report.
+    add_results_text : bool, optional, default: True
+        Whether to add a print out of the model results to the start of the report.
     plot_kwargs : keyword arguments
         Keyword arguments to pass into the plot method.
     """
 
+    fig = _build_model_report(model, add_settings, add_results_text, **plot_kwargs)
+    _save_report_fig(fig, file_name, file_path)
+
+
+def _build_model_report(model, add_settings=True, add_results_text=True, **plot_kwargs):
+    """Build the report figure for a power spectrum model fit.
+
+    Parameters
+    ----------
+    model : SpectralModel
+        Object with results from fitting a power spectrum.
+    add_settings : bool, optional, default: True
+        Whether to add a print out of the model settings to the end of the report.
+    add_results_text : bool, optional, default: True
+        Whether to add a print out of the model results to the start of the report.
+    plot_kwargs : keyword arguments
+        Keyword arguments to pass into the plot method.
+
+    Returns
+    -------
+    fig : matplotlib.Figure
+        Figure containing the report.
+    """
+
     # Define grid settings based on what is to be plotted
-    n_rows = 3 if add_settings else 2
-    height_ratios = [0.5, 1.0, 0.25] if add_settings else [0.45, 1.0]
+    height_ratios = ([0.5 if add_settings else 0.45] if add_results_text else []) + [1.0] + \
+        ([0.25] if add_settings else [])
+    n_rows = len(height_ratios)
+    data_row = 1 if add_results_text else 0
 
     # Set up outline figure, using gridspec
-    _ = plt.figure(figsize=REPORT_FIGSIZE)
+    fig = _get_report_fig(REPORT_FIGSIZE)
     grid = gridspec.GridSpec(n_rows, 1, hspace=0.25, height_ratios=height_ratios)
 
     # First - text results
-    plot_text(gen_model_results_str(model), 0.5, 0.7, ax=plt.subplot(grid[0]))
+    if add_results_text:
+        _add_report_text(fig, grid[0], gen_model_results_str(model), 0.7)
 
     # Second - data plot
-    ax1 = plt.subplot(grid[1])
+    ax1 = fig.add_subplot(grid[data_row])
     model.plot(ax=ax1, **plot_kwargs)
 
     # Third - model settings
     if add_settings:
-        plot_text(gen_settings_str(model, False), 0.5, 0.1, ax=plt.subplot(grid[2]))
+        _add_report_text(fig, grid[-1], gen_settings_str(model, False), 0.1)
 
-    # Save out the report
-    plt.savefig(fpath(file_path, fname(file_name, SAVE_FORMAT)))
-    plt.close()
+    return fig
 
 
 @check_dependency(plt, 'matplotlib')
-def save_group_report(group, file_name, file_path=None, add_settings=True):
+def save_group_report(group, file_name, file_path=None, add_settings=True,
+                      add_results_text=True):
     """Generate and save out a PDF report for models of a group of power spectra.
 
     Parameters
@@ -79,44 +114,70 @@ def save_group_report(group, file_name, file_path=None, add_settings=True):
         Path to directory to save to. If None, saves to current directory.
     add_settings : bool, optional, default: True
         Whether to add a print out of the model settings to the end of the report.
+    add_results_text : bool, optional, default: True
+        Whether to add a print out of the model results to the start of the report.
+    """
+
+    fig = _build_group_report(group, add_settings, add_results_text)
+    _save_report_fig(fig, file_name, file_path)
+
+
+def _build_group_report(group, add_settings=True, add_results_text=True):
+    """Build the report figure for models of a group of power spectra.
+
+    Parameters
+    ----------
+    group : SpectralGroupModel
+        Object with results from fitting a group of power spectra.
+    add_settings : bool, optional, default: True
+        Whether to add a print out of the model settings to the end of the report.
+    add_results_text : bool, optional, default: True
+        Whether to add a print out of the model results to the start of the report.
+
+    Returns
+    -------
+    fig : matplotlib.Figure
+        Figure containing the report.
     """
 
     # Define grid settings based on what is to be plotted
-    n_rows = 4 if add_settings else 3
-    height_ratios = [1.0, 1.0, 1.0, 0.5] if add_settings else [0.8, 1.0, 1.0]
+    height_ratios = ([1.0 if add_settings else 0.8] if add_results_text else []) + [1.0, 1.0] + \
+        ([0.5] if add_settings else [])
+    n_rows = len(height_ratios)
+    data_row = 1 if add_results_text else 0
 
     # Initialize figure
-    _ = plt.figure(figsize=REPORT_FIGSIZE)
+    fig = _get_report_fig(REPORT_FIGSIZE)
     grid = gridspec.GridSpec(n_rows, 2, wspace=0.35, hspace=0.25, height_ratios=height_ratios)
 
     # First / top: text results
-    plot_text(gen_group_results_str(group), 0.5, 0.7, ax=plt.subplot(grid[0, :]))
+    if add_results_text:
+        _add_report_text(fig, grid[0, :], gen_group_results_str(group), 0.7)
 
     # Second - data plots
 
     # Aperiodic parameters plot
-    ax1 = plt.subplot(grid[1, 0])
-    plot_group_aperiodic(group, ax1, custom_styler=None)
+    ax1 = fig.add_subplot(grid[data_row, 0])
+    plot_group_aperiodic(group, ax=ax1, custom_styler=None)
 
     # Goodness of fit plot
-    ax2 = plt.subplot(grid[1, 1])
-    plot_group_goodness(group, ax2, custom_styler=None)
+    ax2 = fig.add_subplot(grid[data_row, 1])
+    plot_group_goodness(group, ax=ax2, custom_styler=None)
 
     # Peak center frequencies plot
-    ax3 = plt.subplot(grid[2, :])
-    plot_group_peak_frequencies(group, ax3, custom_styler=None)
+    ax3 = fig.add_subplot(grid[data_row + 1, :])
+    plot_group_peak_frequencies(group, ax=ax3, custom_styler=None)
 
     # Third - Model settings
     if add_settings:
-        plot_text(gen_settings_str(group, False), 0.5, 0.1, ax=plt.subplot(grid[3, :]))
+        _add_report_text(fig, grid[-1, :], gen_settings_str(group, False), 0.1)
 
-    # Save out the report
-    plt.savefig(fpath(file_path, fname(file_name, SAVE_FORMAT)))
-    plt.close()
+    return fig
 
 
 @check_dependency(plt, 'matplotlib')
-def save_time_report(time_model, file_name, file_path=None, add_settings=True):
+def save_time_report(time_model, file_name, file_path=None, add_settings=True,
+                     add_results_text=True):
     """Generate and save out a PDF report for models of a spectrogram.
 
     Parameters
@@ -129,6 +190,30 @@ def save_time_report(time_model, file_name, file_path=None, add_settings=True):
         Path to directory to save to. If None, saves to current directory.
     add_settings : bool, optional, default: True
         Whether to add a print out of the model settings to the end of the report.
+    add_results_text : bool, optional, default: True
+        Whether to add a print out of the model results to the start of the report.
+    """
+
+    fig = _build_time_report(time_model, add_settings, add_results_text)
+    _save_report_fig(fig, file_name, file_path)
+
+
+def _build_time_report(time_model, add_settings=True, add_results_text=True):
+    """Build the report figure for models of a spectrogram.
+
+    Parameters
+    ----------
+    time_model : SpectralTimeModel
+        Object with results from fitting a spectrogram.
+    add_settings : bool, optional, default: True
+        Whether to add a print out of the model settings to the end of the report.
+    add_results_text : bool, optional, default: True
+        Whether to add a print out of the model results to the start of the report.
+
+    Returns
+    -------
+    fig : matplotlib.Figure
+        Figure containing the report.
     """
 
     # Check model object for number of bands, to decide report size
@@ -136,29 +221,31 @@ def save_time_report(time_model, file_name, file_path=None, add_settings=True):
     n_bands = len(pe_labels['cf'])
 
     # Initialize figure, defining number of axes based on model + what is to be plotted
-    n_rows = 1 + 2 + n_bands + (1 if add_settings else 0)
-    height_ratios = [1.0] + [0.5] * (n_bands + 2) + ([0.4] if add_settings else [])
-    _, axes = plt.subplots(n_rows, 1,
-                           gridspec_kw={'hspace' : 0.35, 'height_ratios' : height_ratios},
-                           figsize=REPORT_FIGSIZE)
+    height_ratios = ([1.0] if add_results_text else []) + [0.5] * (n_bands + 2) + \
+        ([0.4] if add_settings else [])
+    n_rows = len(height_ratios)
+    data_row = 1 if add_results_text else 0
+    fig = _get_report_fig(REPORT_FIGSIZE)
+    grid = gridspec.GridSpec(n_rows, 1, hspace=0.35, height_ratios=height_ratios)
 
     # First / top: text results
-    plot_text(gen_time_results_str(time_model), 0.5, 0.7, ax=axes[0])
+    if add_results_text:
+        _add_report_text(fig, grid[0], gen_time_results_str(time_model), 0.7)
 
     # Second - data plots
-    time_model.plot(axes=axes[1:2+n_bands+1])
+    time_model.plot(axes=[fig.add_subplot(grid[ind])
+                          for ind in range(data_row, data_row + n_bands + 2)])
 
     # Third - Model settings
     if add_settings:
-        plot_text(gen_settings_str(time_model, False), 0.5, 0.1, ax=axes[-1])
+        _add_report_text(fig, grid[-1], gen_settings_str(time_model, False), 0.1)
 
-    # Save out the report
-    plt.savefig(fpath(file_path, fname(file_name, SAVE_FORMAT)))
-    plt.close()
+    return fig
 
 
 @check_dependency(plt, 'matplotlib')
-def save_event_report(event_model, file_name, file_path=None, add_settings=True):
+def save_event_report(event_model, file_name, file_path=None, add_settings=True,
+                      add_results_text=True):
     """Generate and save out a PDF report for models of a set of events.
 
     Parameters
@@ -171,6 +258,30 @@ def save_event_report(event_model, file_name, file_path=None, add_settings=True)
         Path to directory to save to. If None, saves to current directory.
     add_settings : bool, optional, default: True
         Whether to add a print out of the model settings to the end of the report.
+    add_results_text : bool, optional, default: True
+        Whether to add a print out of the model results to the start of the report.
+    """
+
+    fig = _build_event_report(event_model, add_settings, add_results_text)
+    _save_report_fig(fig, file_name, file_path)
+
+
+def _build_event_report(event_model, add_settings=True, add_results_text=True):
+    """Build the report figure for models of a set of events.
+
+    Parameters
+    ----------
+    event_model : SpectralTimeEventModel
+        Object with results from fitting a group of power spectra.
+    add_settings : bool, optional, default: True
+        Whether to add a print out of the model settings to the end of the report.
+    add_results_text : bool, optional, default: True
+        Whether to add a print out of the model results to the start of the report.
+
+    Returns
+    -------
+    fig : matplotlib.Figure
+        Figure containing the report.
     """
 
     # Check model object for number of bands & aperiodic mode, to decide report size
@@ -179,23 +290,166 @@ def save_event_report(event_model, file_name, file_path=None, add_settings=True)
     has_knee = 'knee' in event_model.event_time_results.keys()
 
     # Initialize figure, defining number of axes based on model + what is to be plotted
-    n_rows = 1 + (4 if has_knee else 3) + (n_bands * 5) + 2 + (1 if add_settings else 0)
-    height_ratios = [2.75] + [1] * (3 if has_knee else 2) + \
+    height_ratios = ([2.75] if add_results_text else []) + [1] * (3 if has_knee else 2) + \
         [0.25, 1, 1, 1, 1] * n_bands + [0.25] + [1, 1] + ([1.5] if add_settings else [])
-    _, axes = plt.subplots(n_rows, 1,
-                           gridspec_kw={'hspace' : 0.1, 'height_ratios' : height_ratios},
-                           figsize=(REPORT_FIGSIZE[0], REPORT_FIGSIZE[1] + 7))
+    n_rows = len(height_ratios)
+    data_row = 1 if add_results_text else 0
+    fig = _get_report_fig((REPORT_FIGSIZE[0], REPORT_FIGSIZE[1] + 7))
+    grid = gridspec.GridSpec(n_rows, 1, hspace=0.1, height_ratios=height_ratios)
 
     # First / top: text results
-    plot_text(gen_event_results_str(event_model), 0.5, 0.7, ax=axes[0])
+    if add_results_text:
+        _add_report_text(fig, grid[0], gen_event_results_str(event_model), 0.7)
 
     # Second - data plots
-    event_model.plot(axes=axes[1:-1])
+    n_plot_rows = n_rows - (1 if add_settings else 0)
+    event_model.plot(axes=[fig.add_subplot(grid[ind]) for ind in range(data_row, n_plot_rows)])
 
     # Third - Model settings
     if add_settings:
-        plot_text(gen_settings_str(event_model, False), 0.5, 0.1, ax=axes[-1])
+        _add_report_text(fig, grid[-1], gen_settings_str(event_model, False), 0.1)
+
+    return fig
+
+
+@check_dependency(plt, 'matplotlib')
+def save_reports_multipage(models, file_name, file_path=None, report_fn=save_model_report,
+                           **kwargs):
+    """Generate and save out reports for a set of model objects, as pages of a single PDF.
+
+    Parameters
+    ----------
+    models : list of model objects
+        Objects with model results to create reports for, with one page per object.
+    file_name : str
+        Name to give the saved out file.
+    file_path : Path or str, optional
+        Path to directory to save to. If None, saves to current directory.
+    report_fn : callable, optional, default: save_model_report
+        Report function for the type of model objects, which defines the report layout.
+    **kwargs
+        Keyword arguments to pass into the report function, such as `add_settings`.
+
+    Notes
+    -----
+    Writing all reports into one file means the PDF structure and embedded fonts are
+    created once, rather than once per report, which is faster when there are many models.
+    """
+
+    build_fn = _REPORT_BUILDERS[report_fn]
+
+    with backend_pdf.PdfPages(fpath(file_path, fname(file_name, SAVE_FORMAT))) as pdf:
+        for model in models:
+            fig = build_fn(model, **kwargs)
+            _rasterize_data(fig)
+            pdf.savefig(fig, dpi=REPORT_DPI)
+            fig.clf()
+
+
+def close_report_cache():
+    """Clear the cached figure that is re-used across reports."""
+
+    _REPORT_FIG['fig'] = None
+
+
+def _get_report_fig(figsize):
+    """Get a cleared figure to create a report in, re-using a cached figure if available.
+
+    Parameters
+    ----------
+    figsize : tuple of float
+        Size of the figure.
+
+    Returns
+    -------
+    fig : matplotlib.Figure
+        Figure to create the report in.
+
+    Notes
+    -----
+    The figure is not managed by pyplot, so it is not affected by, nor shown by, pyplot calls.
+    """
+
+    fig = _REPORT_FIG['fig']
+
+    if fig is None:
+        fig = mfigure.Figure(figsize=figsize)
+        _REPORT_FIG['fig'] = fig
+    else:
+        fig.clf()
+        # Reset any layout engine that may have been set by plot styling of a previous report
+        if hasattr(fig, 'set_layout_engine'):
+            fig.set_layout_engine('none')
+        if tuple(fig.get_size_inches()) != tuple(figsize):
+            fig.set_size_inches(*figsize)
+
+    return fig
+
+
+def _save_report_fig(fig, file_name, file_path=None):
+    """Save out a report figure to file, and clear the figure.
+
+    Parameters
+    ----------
+    fig : matplotlib.Figure
+        Report figure to save out.
+    file_name : str
+        Name to give the saved out file.
+    file_path : Path or str, optional
+        Path to directory to save to. If None, saves to current directory.
+    """
+
+    _rasterize_data(fig)
+    fig.savefig(fpath(file_path, fname(file_name, SAVE_FORMAT)), dpi=REPORT_DPI)
+    fig.clf()
+
+
+def _rasterize_data(fig):
+    """Set the plotted data in a report figure to be rasterized when saved.
+
+    Parameters
+    ----------
+    fig : matplotlib.Figure
+        Report figure to update.
+
+    Notes
+    -----
+    Only data artists (lines, collections & patches) are rasterized, so text stays as vector.
+    """
+
+    for ax in fig.axes:
+        for artist in [*ax.lines, *ax.collections, *ax.patches]:
+            artist.set_rasterized(True)
+
+
+def _add_report_text(fig, grid_cell, text, y_pos):
+    """Add text to a report figure, positioned within a cell of the figure grid.
+
+    Parameters
+    ----------
+    fig : matplotlib.Figure
+        Report figure to add the text to.
+    grid_cell : matplotlib.gridspec.SubplotSpec
+        Cell of the figure grid in which to place the text.
+    text : str
+        Text to add.
+    y_pos : float
+        Vertical position of the text, as a fraction of the height of the grid cell.
+
+    Notes
+    -----
+    Text is added directly to the figure, which avoids creating an empty axis for each text block.
+    """
+
+    bbox = grid_cell.get_position(fig)
+    fig.text(bbox.x0 + 0.5 * bbox.width, bbox.y0 + y_pos * bbox.height, text,
+             fontdict=PLT_TEXT_FONT, ha='center', va='center')
+
 
-    # Save out the report
-    plt.savefig(fpath(file_path, fname(file_name, SAVE_FORMAT)))
-    plt.close()
+# Mapping of report functions to the functions that build their report figures
+_REPORT_BUILDERS = {
+    save_model_report : _build_model_report,
+    save_group_report : _build_group_report,
+    save_time_report : _build_time_report,
+    save_event_report : _build_event_report,
+}
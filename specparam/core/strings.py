@@ -1,5 +1,7 @@
 """Formatted strings for printing out model and fit related information."""
 
+from functools import lru_cache
+
 import numpy as np
 
 from specparam.core.errors import NoModelError
@@ -16,6 +18,10 @@ from specparam.version import __version__ as MODULE_VERSION
 LCV = 98
 SCV = 70
 
+# Labels of the model settings, in the order they are printed
+SETTINGS_LABELS = ['peak_width_limits', 'max_n_peaks', 'min_peak_height',
+                   'peak_threshold', 'aperiodic_mode']
+
 ###################################################################################################
 ###################################################################################################
 
@@ -101,8 +107,39 @@ def gen_settings_str(model_obj, description=False, concise=False):
     -------
     output : str
         Formatted string of current settings.
+
+    Notes
+    -----
+    Outputs are cached, based on the values of the settings, as the same settings are often
+    printed repeatedly, for example when saving reports across many model objects.
+    """
+
+    settings = tuple('{}'.format(getattr(model_obj, label)) for label in SETTINGS_LABELS)
+
+    return _gen_settings_str(settings, description, concise)
+
+
+@lru_cache(maxsize=32)
+def _gen_settings_str(settings, description, concise):
+    """Generate a string representation of fit settings, from formatted setting values.
+
+    Parameters
+    ----------
+    settings : tuple of str
+        Formatted values of the settings, in the order of `SETTINGS_LABELS`.
+    description : bool
+        Whether to also print out a description of the settings.
+    concise : bool
+        Whether to print the report in concise mode.
+
+    Returns
+    -------
+    output : str
+        Formatted string of the settings.
     """
 
+    settings = dict(zip(SETTINGS_LABELS, settings))
+
     # Parameter descriptions to print out, if requested
     desc = {
         'peak_width_limits' : 'Limits for minimum and maximum peak widths, in Hz.',
@@ -126,15 +163,15 @@ def gen_settings_str(model_obj, description=False, concise=False):
         '',
 
         # Settings - include descriptions if requested
-        *[el for el in ['Peak Width Limits : {}'.format(model_obj.peak_width_limits),
+        *[el for el in ['Peak Width Limits : {}'.format(settings['peak_width_limits']),
                         '{}'.format(desc['peak_width_limits']),
-                        'Max Number of Peaks : {}'.format(model_obj.max_n_peaks),
+                        'Max Number of Peaks : {}'.format(settings['max_n_peaks']),
                         '{}'.format(desc['max_n_peaks']),
-                        'Minimum Peak Height : {}'.format(model_obj.min_peak_height),
+                        'Minimum Peak Height : {}'.format(settings['min_peak_height']),
                         '{}'.format(desc['min_peak_height']),
-                        'Peak Threshold: {}'.format(model_obj.peak_threshold),
+                        'Peak Threshold: {}'.format(settings['peak_threshold']),
                         '{}'.format(desc['peak_threshold']),
-                        'Aperiodic Mode : {}'.format(model_obj.aperiodic_mode),
+                        'Aperiodic Mode : {}'.format(settings['aperiodic_mode']),
                         '{}'.format(desc['aperiodic_mode'])] if el != ''],
 
         # Footer
@@ -1,5 +1,7 @@
 """"Utility functions for working with data and data objects."""
 
+import re
+
 import numpy as np
 
 from specparam.core.info import get_indices
@@ -8,6 +10,9 @@ from specparam.core.funcs import infer_ap_func
 ###################################################################################################
 ###################################################################################################
 
+# Pattern for periodic labels, which are organized as '{band}_{param}' or '{param}_{index}'
+_PERIODIC_RE = re.compile(r'(?:^|_)(cf|pw|bw)(?:_|$)')
+
 def get_model_params(fit_results, name, col=None):
     """Return model fit parameters for specified feature(s).
 
@@ -120,11 +125,11 @@ def get_periodic_labels(results):
         Has keys ['cf', 'pw', 'bw'] with corresponding values of related labels in the input.
     """
 
-    keys = list(results.keys())
-
-    outs = {}
-    for label in ['cf', 'pw', 'bw']:
-        outs[label] = [key for key in keys if label in key]
+    outs = {'cf' : [], 'pw' : [], 'bw' : []}
+    for key in results.keys():
+        match = _PERIODIC_RE.search(key)
+        if match:
+            outs[match.group(1)].append(key)
 
     return outs
 
@@ -148,13 +153,8 @@ def get_band_labels(indict):
     if 'offset' in indict:
         indict = get_periodic_labels(indict)
 
-    n_bands = len(indict['cf'])
-
-    band_labels = []
-    for ind in range(n_bands):
-        tband_label = indict['cf'][ind].split('_')
-        tband_label.remove('cf')
-        band_labels.append(tband_label[0])
+    # Drop the parameter part of each label, leaving the band label
+    band_labels = [_PERIODIC_RE.sub('', label, count=1) for label in indict['cf']]
 
     return band_labels
 
@@ -187,17 +187,27 @@ def get_results_by_row(results, ind):
 
     Parameters
     ----------
-    results : dict
+    results : dict or structured array
         A results dictionary with parameter label keys and corresponding parameter values.
+        Can also be a structured array of results, as returned by `get_results_as_struct`.
     ind : int
         Index to extract from results.
 
     Returns
     -------
-    dict
+    dict or structured array
         Dictionary including the results for the specified index.
+        If the input is a structured array, the output is a view of the specified row.
+
+    Notes
+    -----
+    To select many rows, it is faster to convert the results to a structured array once, with
+    `get_results_as_struct`, and pass that in, as each row selection is then a view.
     """
 
+    if isinstance(results, np.ndarray):
+        return results[ind]
+
     outs = {}
     for key in results.keys():
         outs[key] = results[key][ind, :]
@@ -205,6 +215,29 @@ def get_results_by_row(results, ind):
     return outs
 
 
+def get_results_as_struct(results):
+    """Convert a dictionary of results across events into a structured array.
+
+    Parameters
+    ----------
+    results : dict
+        Results dictionary wherein parameters are organized in 2d arrays as [n_events, n_windows].
+
+    Returns
+    -------
+    struct : structured array
+        Structured array of results, with one row per event, and a field per parameter label.
+    """
+
+    dtype = np.dtype([(key, values.dtype, values.shape[1:]) for key, values in results.items()])
+
+    struct = np.empty(len(next(iter(results.values()))), dtype=dtype)
+    for key, values in results.items():
+        struct[key] = values
+
+    return struct
+
+
 def flatten_results_dict(results):
     """Flatten a results dictionary containing results across events.
 
@@ -753,9 +753,10 @@ class SpectralModel():
 
 
     @copy_doc_func_to_method(save_model_report)
-    def save_report(self, file_name, file_path=None, add_settings=True, **plot_kwargs):
+    def save_report(self, file_name, file_path=None, add_settings=True,
+                    add_results_text=True, **plot_kwargs):
 
-        save_model_report(self, file_name, file_path, add_settings, **plot_kwargs)
+        save_model_report(self, file_name, file_path, add_settings, add_results_text, **plot_kwargs)
 
 
     @copy_doc_func_to_method(save_model)
@@ -351,9 +351,9 @@ class SpectralGroupModel(SpectralModel):
 
 
     @copy_doc_func_to_method(save_group_report)
-    def save_report(self, file_name, file_path=None, add_settings=True):
+    def save_report(self, file_name, file_path=None, add_settings=True, add_results_text=True):
 
-        save_group_report(self, file_name, file_path, add_settings)
+        save_group_report(self, file_name, file_path, add_settings, add_results_text)
 
 
     @copy_doc_func_to_method(save_group)
@@ -300,9 +300,9 @@ class SpectralTimeModel(SpectralGroupModel):
 
 
     @copy_doc_func_to_method(save_time_report)
-    def save_report(self, file_name, file_path=None, add_settings=True):
+    def save_report(self, file_name, file_path=None, add_settings=True, add_results_text=True):
 
-        save_time_report(self, file_name, file_path, add_settings)
+        save_time_report(self, file_name, file_path, add_settings, add_results_text)
 
 
     def load(self, file_name, file_path=None, peak_org=None):
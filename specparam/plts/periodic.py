@@ -1,18 +1,24 @@
 """Plots for periodic fits and parameters."""
 
-from itertools import cycle
+from itertools import cycle, islice
+from functools import lru_cache
+from collections.abc import Iterator
 
 import numpy as np
 
 from specparam.sim import gen_freqs
-from specparam.core.funcs import gaussian_function
 from specparam.core.modutils import safe_import, check_dependency
 from specparam.plts.settings import PLT_FIGSIZES
 from specparam.plts.templates import plot_yshade
 from specparam.plts.style import style_param_plot, style_plot
-from specparam.plts.utils import check_ax, recursive_plot, savefig, check_plot_kwargs
+from specparam.plts.utils import check_ax, savefig, check_plot_kwargs
 
 plt = safe_import('.pyplot', 'matplotlib')
+mcollections = safe_import('.collections', 'matplotlib')
+mcolors = safe_import('.colors', 'matplotlib')
+
+# Cache of the default color list, and the color cycle it was computed from
+_COLOR_CACHE = {'prop_cycle' : None, 'colors' : None}
 
 ###################################################################################################
 ###################################################################################################
@@ -37,33 +43,39 @@ def plot_peak_params(peaks, freq_range=None, colors=None, labels=None, ax=None,
         Figure axes upon which to plot.
     **plot_kwargs
         Additional plot related keyword arguments, with styling options managed by ``style_plot``.
+
+    Notes
+    -----
+    If `colors` is given per-point, with few unique colors, points are plotted grouped by color.
+    This means overlapping points are drawn in order of color group, rather than input order.
     """
 
     ax = check_ax(ax, plot_kwargs.pop('figsize', PLT_FIGSIZES['params']))
 
-    # If there is a list, use recurse function to loop across arrays of data and plot them
+    # Check plot settings, which are shared across all plotted arrays of data
+    size = plot_kwargs.pop('s', 150)
+    plot_kwargs = check_plot_kwargs(plot_kwargs, {'alpha' : 0.7})
+
+    # If there is a list, loop across arrays of data and plot them
     if isinstance(peaks, list):
-        recursive_plot(peaks, plot_peak_params, ax, colors=colors, labels=labels)
+        colors = _broadcast_opt(colors, len(peaks))
+        labels = _broadcast_opt(labels, len(peaks))
+        for ind, cur_peaks in enumerate(peaks):
+            _plot_peak_params_one(ax, cur_peaks, colors[ind], labels[ind], size, **plot_kwargs)
 
     # Otherwise, plot the array of data
     else:
-
-        # Unpack data: CF as x; PW as y; BW as size
-        xs, ys = peaks[:, 0], peaks[:, 1]
-        sizes = peaks[:, 2] * plot_kwargs.pop('s', 150)
-
-        # Create the plot
-        plot_kwargs = check_plot_kwargs(plot_kwargs, {'alpha' : 0.7})
-        ax.scatter(xs, ys, sizes, c=colors, label=labels, **plot_kwargs)
+        _plot_peak_params_one(ax, peaks, colors, labels, size, **plot_kwargs)
 
     # Add axis labels
     ax.set_xlabel('Center Frequency')
     ax.set_ylabel('Power')
 
-    # Set plot limits
+    # Set plot limits, with the upper y-limit computed from the plotted powers
     if freq_range:
         ax.set_xlim(freq_range)
-    ax.set_ylim([0, ax.get_ylim()[1]])
+    pws = [el[:, 1] for el in peaks] if isinstance(peaks, list) else [peaks[:, 1]]
+    _set_ylim(ax, max(np.fmax.reduce(el, initial=np.nan) for el in pws))
 
     style_param_plot(ax)
 
@@ -76,7 +88,7 @@ def plot_peak_fits(peaks, freq_range=None, average='mean', shade='sem', plot_ind
 
     Parameters
     ----------
-    peaks : 2d array
+    peaks : 2d array or list of 2d array
         Peak data. Each row is a peak, as [CF, PW, BW].
     freq_range : list of [float, float] , optional
         The frequency range to plot the peak fits across, as [f_min, f_max].
@@ -102,57 +114,292 @@ def plot_peak_fits(peaks, freq_range=None, average='mean', shade='sem', plot_ind
 
     ax = check_ax(ax, plot_kwargs.pop('figsize', PLT_FIGSIZES['params']))
 
+    # Collect plot settings, which are shared across all plotted arrays of data
+    plot_settings = {'average' : average, 'shade' : shade, 'plot_individual' : plot_individual,
+                     'shade_alpha' : plot_kwargs.pop('shade_alpha', 0.15)}
+
+    # If there is a list, loop across arrays of data and plot them
     if isinstance(peaks, list):
 
         if not colors:
-            colors = cycle(plt.rcParams['axes.prop_cycle'].by_key()['color'])
+            colors = cycle(_get_default_colors())
+
+        colors = _broadcast_opt(colors, len(peaks))
+        labels = _broadcast_opt(labels, len(peaks))
+
+        freq_ranges = []
+        for ind, cur_peaks in enumerate(peaks):
+            freq_ranges.append(_plot_peak_fits_one(ax, cur_peaks, freq_range, colors[ind],
+                                                   labels[ind], **plot_settings))
+
+        # If not given, set the frequency range to span the ranges of all the plotted data
+        if not freq_range and freq_ranges:
+            freq_range = [min(frange[0] for frange in freq_ranges),
+                          max(frange[1] for frange in freq_ranges)]
+
+    # Otherwise, plot the array of data, with a single color
+    else:
+        this_color = next(colors) if isinstance(colors, Iterator) else \
+            (colors[0] if isinstance(colors, list) else colors)
+        freq_range = _plot_peak_fits_one(ax, peaks, freq_range, this_color, labels,
+                                         **plot_settings)
+
+    # Add axis labels
+    ax.set_xlabel('Frequency')
+    ax.set_ylabel('log(Power)')
+
+    # Set plot limits, with the upper y-limit taken from the extent of the plotted data
+    ax.set_xlim(freq_range)
+    _set_ylim(ax, ax.dataLim.y1)
+
+    # Apply plot style
+    style_param_plot(ax)
+
 
-        recursive_plot(peaks, plot_function=plot_peak_fits, ax=ax,
-                       freq_range=tuple(freq_range) if freq_range else freq_range,
-                       colors=colors, labels=labels, **plot_kwargs)
+def _plot_peak_params_one(ax, peaks, colors, labels, size, **plot_kwargs):
+    """Plot peak parameters for a single array of peaks.
 
+    Parameters
+    ----------
+    ax : matplotlib.Axes
+        Figure axes upon which to plot.
+    peaks : 2d array
+        Peak data. Each row is a peak, as [CF, PW, BW].
+    colors : str or list of str or None
+        Color(s) to plot data.
+    labels : str or None
+        Label for plotted data, to be added in a legend.
+    size : float
+        Scaling factor to apply to the bandwidth values, to set the size of the dots.
+    **plot_kwargs
+        Additional keyword arguments to pass into the scatter call.
+    """
+
+    # Unpack data: CF as x; PW as y; BW as size
+    xs, ys = peaks[:, 0], peaks[:, 1]
+    sizes = peaks[:, 2] * size
+
+    # If there are per-point colors, with few unique values, plot each color group separately
+    #   Each scatter call then has a single color, which is much faster for matplotlib to draw
+    color_groups = _group_colors(colors, len(peaks))
+    if color_groups:
+        for ind, (color, mask) in enumerate(color_groups):
+            ax.scatter(xs[mask], ys[mask], sizes[mask], c=color,
+                       label=labels if ind == 0 else None, **plot_kwargs)
     else:
+        ax.scatter(xs, ys, sizes, c=colors, label=labels, **plot_kwargs)
+
 
-        if not freq_range:
+def _plot_peak_fits_one(ax, peaks, freq_range, color, labels, average, shade,
+                        plot_individual, shade_alpha):
+    """Plot reconstructions of model peak fits for a single array of peaks.
 
-            # Extract all the CF values, excluding any NaNs
-            cfs = peaks[~np.isnan(peaks[:, 0]), 0]
+    Parameters
+    ----------
+    ax : matplotlib.Axes
+        Figure axes upon which to plot.
+    peaks : 2d array
+        Peak data. Each row is a peak, as [CF, PW, BW].
+    freq_range : list of [float, float] or None
+        The frequency range to plot the peak fits across, as [f_min, f_max].
+        If None, defaults to +/- 4 around given peak center frequencies.
+    color : str or None
+        Color to plot data.
+    labels : str or None
+        Label for plotted data, to be added in a legend.
+    average, shade, plot_individual
+        Settings for the plot. See `plot_peak_fits` for details.
+    shade_alpha : float
+        Alpha level for the shading around the average.
+
+    Returns
+    -------
+    freq_range : list of [float, float]
+        The frequency range the peak fits were plotted across.
+    """
 
-            # Define the frequency range as +/- buffer around the data range
-            #   This also doesn't let the plot range drop below 0
-            f_buffer = 4
-            freq_range = [cfs.min() - f_buffer if cfs.min() - f_buffer > 0 else 0,
-                          cfs.max() + f_buffer]
+    if not freq_range:
 
-        # Create the frequency axis, which will be the plot x-axis
-        freqs = gen_freqs(freq_range, 0.1)
+        # Get the range of the CF values, ignoring any NaNs
+        cf_min, cf_max = np.nanmin(peaks[:, 0]), np.nanmax(peaks[:, 0])
 
-        colors = colors[0] if isinstance(colors, list) else colors
+        # Define the frequency range as +/- buffer around the data range
+        #   This also doesn't let the plot range drop below 0
+        f_buffer = 4
+        freq_range = [max(0, cf_min - f_buffer), cf_max + f_buffer]
 
-        all_peak_vals = np.zeros(shape=(len(peaks), len(freqs)))
-        for ind, peak_params in enumerate(peaks):
+    # Create the frequency axis, which will be the plot x-axis
+    freqs = _gen_freqs_cached(float(freq_range[0]), float(freq_range[1]), 0.1)
 
-            # Create & collect the peak model from parameters
-            peak_vals = gaussian_function(freqs, *peak_params)
-            all_peak_vals[ind, :] = peak_vals
+    # Create the peak model for all peaks at once, as a [n_peaks, n_freqs] array
+    #   This is written directly into the y-values of line segments, as [n_peaks, n_freqs, 2]
+    segments = np.empty(shape=(len(peaks), len(freqs), 2))
+    segments[:, :, 0] = freqs
+    all_peak_vals = _gauss_inplace(freqs, peaks[:, 0:1], peaks[:, 1:2], peaks[:, 2:3],
+                                   segments[:, :, 1])
 
-            if plot_individual:
-                ax.plot(freqs, peak_vals, color=colors, alpha=0.35, linewidth=1.25)
+    # Plot all the individual components as a single collection of lines
+    if plot_individual:
+        line_colors = color if color else _get_default_colors()
+        ax.add_collection(mcollections.LineCollection(segments, colors=line_colors,
+                                                      alpha=0.35, linewidth=1.25))
+        ax.autoscale_view()
 
-        # Plot the average across all components
-        if average is not False:
-            avg_color = 'black' if not colors else colors
-            plot_yshade(freqs, all_peak_vals, average=average, shade=shade,
-                        shade_alpha=plot_kwargs.pop('shade_alpha', 0.15),
-                        color=avg_color, linewidth=3.75, label=labels, ax=ax)
+    # Plot the average across all components
+    if average is not False:
+        avg_color = color if color else 'black'
+        plot_yshade(freqs, all_peak_vals, average=average, shade=shade, shade_alpha=shade_alpha,
+                    color=avg_color, linewidth=3.75, label=labels, ax=ax)
 
-    # Add axis labels
-    ax.set_xlabel('Frequency')
-    ax.set_ylabel('log(Power)')
+    return freq_range
 
-    # Set plot limits
-    ax.set_xlim(freq_range)
-    ax.set_ylim([0, ax.get_ylim()[1]])
 
-    # Apply plot style
-    style_param_plot(ax)
+def _broadcast_opt(opt, n_values):
+    """Broadcast a plot option to a list of values, with one value per array of data.
+
+    Parameters
+    ----------
+    opt : iterator or list or object
+        Plot option. If an iterator, the next `n_values` values are taken from it.
+        If a list, it is assumed to have one element per array of data.
+        Otherwise, including if None, the same value is used for all arrays of data.
+    n_values : int
+        Number of arrays of data.
+
+    Returns
+    -------
+    list
+        Values for the plot option, one per array of data.
+    """
+
+    if isinstance(opt, Iterator):
+        return list(islice(opt, n_values))
+
+    return opt if isinstance(opt, list) else [opt] * n_values
+
+
+def _gauss_inplace(freqs, cfs, pws, bws, out):
+    """Evaluate gaussians in place, writing into a pre-allocated output array.
+
+    Parameters
+    ----------
+    freqs : 1d array
+        Frequency values to evaluate the gaussians across.
+    cfs, pws, bws : float or 2d array
+        Center frequency, power and bandwidth of the gaussians, each with shape [n_peaks, 1].
+    out : 2d array
+        Output array, of shape [n_peaks, n_freqs], that is filled in with the gaussian values.
+
+    Returns
+    -------
+    out : 2d array
+        Output array, filled in with the gaussian values.
+
+    Notes
+    -----
+    This is equivalent to `gaussian_function`, per peak, but avoids allocating temporary arrays.
+    """
+
+    np.subtract(freqs, cfs, out=out)
+    out *= out
+    out /= -2 * bws * bws
+    np.exp(out, out=out)
+    out *= pws
+
+    return out
+
+
+def _group_colors(colors, n_points, max_groups=10):
+    """Group per-point colors into sets of points that share the same color.
+
+    Parameters
+    ----------
+    colors : str or list of str or array, optional
+        Color(s) to plot data.
+    n_points : int
+        Number of points that are to be plotted.
+    max_groups : int, optional, default: 10
+        Maximum number of unique colors for which to group the points.
+
+    Returns
+    -------
+    groups : list of tuple of (2d array, 1d array) or None
+        Each unique color, as an array of shape [1, 4], and a boolean mask of the points with it.
+        None if colors are not per-point colors, or if there are more than `max_groups` of them.
+    """
+
+    if colors is None or isinstance(colors, str) or mcolors.is_color_like(colors) \
+        or len(colors) != n_points:
+        return None
+
+    try:
+        rgba = mcolors.to_rgba_array(colors)
+    except ValueError:
+        return None
+
+    unique, inverse = np.unique(rgba, axis=0, return_inverse=True)
+    if len(unique) > max_groups:
+        return None
+
+    inverse = inverse.ravel()
+
+    return [(color[None, :], inverse == ind) for ind, color in enumerate(unique)]
+
+
+def _get_default_colors():
+    """Get the list of default colors, from the current matplotlib color cycle.
+
+    Returns
+    -------
+    colors : list of str
+        Default colors.
+
+    Notes
+    -----
+    The color list is cached, and only recomputed if the color cycle in `rcParams` has changed.
+    """
+
+    prop_cycle = plt.rcParams['axes.prop_cycle']
+    if prop_cycle is not _COLOR_CACHE['prop_cycle']:
+        _COLOR_CACHE['prop_cycle'] = prop_cycle
+        _COLOR_CACHE['colors'] = prop_cycle.by_key()['color']
+
+    return _COLOR_CACHE['colors']
+
+
+@lru_cache(maxsize=64)
+def _gen_freqs_cached(f_min, f_max, freq_res):
+    """Generate a frequency vector, caching outputs across calls.
+
+    Parameters
+    ----------
+    f_min, f_max : float
+        Frequency range to create frequencies across, inclusive.
+    freq_res : float
+        Frequency resolution for the frequency vector.
+
+    Returns
+    -------
+    freqs : 1d array
+        Frequency values, in linear spacing. This array is shared across calls, and is read-only.
+    """
+
+    freqs = gen_freqs([f_min, f_max], freq_res)
+    freqs.flags.writeable = False
+
+    return freqs
+
+
+def _set_ylim(ax, y_max):
+    """Set the y-limits of a plot, from 0 to slightly above a given maximum value.
+
+    Parameters
+    ----------
+    ax : matplotlib.Axes
+        Figure axes to set the limits for.
+    y_max : float
+        Maximum value of the plotted data.
+        If not finite, the current upper limit of the axis is used instead.
+    """
+
+    ax.set_ylim([0, y_max * 1.05 if np.isfinite(y_max) else ax.get_ylim()[1]])
@@ -79,7 +79,10 @@ def style_param_plot(ax):
     # If labels were provided, add a legend and standardize the dot size
     if ax.get_legend_handles_labels()[0]:
         legend = ax.legend(prop={'size': 16})
-        for handle in legend.legendHandles:
+        #   Note: `legendHandles` was renamed to `legend_handles` in matplotlib 3.7
+        handles = legend.legend_handles if hasattr(legend, 'legend_handles') \
+            else legend.legendHandles
+        for handle in handles:
             handle._sizes = [100]
 
 
@@ -184,11 +187,11 @@ def apply_custom_style(ax, **kwargs):
     # Apply tight layout to the figure object, if matplotlib is new enough
     #   If available, `.set_layout_engine` should be equivalent to
     #   `plt.tight_layout()`, but seems to raise fewer warnings...
+    fig = ax.get_figure()
     try:
-        fig = plt.gcf()
         fig.set_layout_engine('tight')
     except:
-        plt.tight_layout()
+        fig.tight_layout()
 
 
 def apply_style(ax, axis_styler=apply_axis_style, line_styler=apply_line_style,
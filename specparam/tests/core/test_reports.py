@@ -5,6 +5,7 @@ import os
 from specparam.tests.settings import TEST_REPORTS_PATH
 
 from specparam.core.reports import *
+from specparam.core.reports import _get_report_fig, _rasterize_data
 
 ###################################################################################################
 ###################################################################################################
@@ -17,6 +18,12 @@ def test_save_model_report(tfm, skip_if_no_mpl):
 
     assert os.path.exists(TEST_REPORTS_PATH / (file_name + '.pdf'))
 
+    # Test without the text panels
+    save_model_report(tfm, file_name + '_notext', TEST_REPORTS_PATH,
+                      add_settings=False, add_results_text=False)
+
+    assert os.path.exists(TEST_REPORTS_PATH / (file_name + '_notext.pdf'))
+
 def test_save_group_report(tfg, skip_if_no_mpl):
 
     file_name = 'test_group_report'
@@ -25,6 +32,12 @@ def test_save_group_report(tfg, skip_if_no_mpl):
 
     assert os.path.exists(TEST_REPORTS_PATH / (file_name + '.pdf'))
 
+    # Test without the text panels
+    save_group_report(tfg, file_name + '_notext', TEST_REPORTS_PATH,
+                      add_settings=False, add_results_text=False)
+
+    assert os.path.exists(TEST_REPORTS_PATH / (file_name + '_notext.pdf'))
+
 def test_save_time_report(tft, skip_if_no_mpl):
 
     file_name = 'test_time_report'
@@ -33,6 +46,12 @@ def test_save_time_report(tft, skip_if_no_mpl):
 
     assert os.path.exists(TEST_REPORTS_PATH / (file_name + '.pdf'))
 
+    # Test without the text panels
+    save_time_report(tft, file_name + '_notext', TEST_REPORTS_PATH,
+                     add_settings=False, add_results_text=False)
+
+    assert os.path.exists(TEST_REPORTS_PATH / (file_name + '_notext.pdf'))
+
 def test_save_event_report(tfe, skip_if_no_mpl):
 
     file_name = 'test_event_report'
@@ -40,3 +59,54 @@ def test_save_event_report(tfe, skip_if_no_mpl):
     save_event_report(tfe, file_name, TEST_REPORTS_PATH)
 
     assert os.path.exists(TEST_REPORTS_PATH / (file_name + '.pdf'))
+
+    # Test without the text panels
+    save_event_report(tfe, file_name + '_notext', TEST_REPORTS_PATH,
+                      add_settings=False, add_results_text=False)
+
+    assert os.path.exists(TEST_REPORTS_PATH / (file_name + '_notext.pdf'))
+
+def test_save_reports_multipage(tfm, skip_if_no_mpl):
+
+    file_name = 'test_multipage_report'
+
+    save_reports_multipage([tfm, tfm], file_name, TEST_REPORTS_PATH)
+    assert os.path.exists(TEST_REPORTS_PATH / (file_name + '.pdf'))
+
+    file_name = 'test_multipage_report_nosettings'
+    save_reports_multipage([tfm, tfm, tfm], file_name, TEST_REPORTS_PATH,
+                           report_fn=save_model_report, add_settings=False)
+    assert os.path.exists(TEST_REPORTS_PATH / (file_name + '.pdf'))
+
+    # Check that there is one page per model
+    with open(TEST_REPORTS_PATH / (file_name + '.pdf'), 'rb') as f_obj:
+        assert b'/Count 3' in f_obj.read()
+
+def test_report_fig_cache(skip_if_no_mpl):
+
+    close_report_cache()
+
+    fig1 = _get_report_fig((4, 4))
+    fig1.add_subplot()
+    fig2 = _get_report_fig((6, 4))
+    assert fig2 is fig1
+    assert not fig2.axes
+    assert tuple(fig2.get_size_inches()) == (6, 4)
+
+    close_report_cache()
+    assert _get_report_fig((6, 4)) is not fig1
+
+def test_rasterize_data(skip_if_no_mpl):
+
+    fig = _get_report_fig((4, 4))
+    ax = fig.add_subplot()
+    ax.plot([1, 2, 3])
+    ax.scatter([1, 2, 3], [1, 2, 3])
+    ax.set_title('title')
+
+    _rasterize_data(fig)
+    assert ax.lines[0].get_rasterized()
+    assert ax.collections[0].get_rasterized()
+    assert not ax.title.get_rasterized()
+
+    close_report_cache()
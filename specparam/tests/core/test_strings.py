@@ -18,6 +18,12 @@ def test_gen_settings_str(tfm):
 
     assert gen_settings_str(tfm)
 
+    # Check that outputs are cached, and that updated settings are reflected
+    settings = tfm.get_settings()
+    assert gen_settings_str(settings) is gen_settings_str(settings)
+    new_settings = settings._replace(peak_threshold=settings.peak_threshold + 1)
+    assert gen_settings_str(new_settings) != gen_settings_str(settings)
+
 def test_gen_freq_range_str(tfm):
 
     assert gen_freq_range_str(tfm)
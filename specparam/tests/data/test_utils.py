@@ -104,6 +104,13 @@ def test_get_band_labels():
     band_labels2 = get_band_labels(tdict2)
     assert band_labels2 == ['alpha', 'beta']
 
+    tdict3 = {'cf': ['cf_0', 'cf_1'],
+              'pw': ['pw_0', 'pw_1'],
+              'bw': ['bw_0', 'bw_1']}
+
+    band_labels3 = get_band_labels(tdict3)
+    assert band_labels3 == ['0', '1']
+
 def test_get_results_by_ind():
 
     tdict = {
@@ -153,6 +160,27 @@ def test_get_results_by_row():
     for key in tdict.keys():
         assert np.array_equal(out1[key], tdict[key][ind])
 
+    # Test with a structured array input
+    struct = get_results_as_struct(tdict)
+    for ind in [0, 1]:
+        out = get_results_by_row(struct, ind)
+        for key in tdict.keys():
+            assert np.array_equal(out[key], tdict[key][ind])
+
+def test_get_results_as_struct():
+
+    tdict = {
+        'offset' : np.array([[0, 1], [2, 3]]),
+        'exponent' : np.array([[0., 1.], [2., 3.]]),
+        'alpha_cf' : np.array([[0., 1.], [2., np.nan]]),
+    }
+
+    struct = get_results_as_struct(tdict)
+    assert struct.shape == (2,)
+    assert list(struct.dtype.names) == list(tdict.keys())
+    for key in tdict.keys():
+        assert np.array_equal(struct[key], tdict[key], equal_nan=True)
+
 def test_flatten_results_dict():
 
     tdict = {
@@ -5,7 +5,12 @@ import numpy as np
 from specparam.tests.tutils import plot_test
 from specparam.tests.settings import TEST_PLOTS_PATH
 
+from specparam.core.funcs import gaussian_function
+from specparam.sim.gen import gen_freqs
+
 from specparam.plts.periodic import *
+from specparam.plts.periodic import (_gauss_inplace, _group_colors, _get_default_colors,
+                                     _gen_freqs_cached, _broadcast_opt)
 
 ###################################################################################################
 ###################################################################################################
@@ -18,6 +23,18 @@ def test_plot_peak_params(skip_if_no_mpl):
     # Test with a single set of params
     plot_peak_params(peaks)
 
+    # Test with per-point colors, which should be plotted as one collection per color
+    from matplotlib.pyplot import subplots
+    from matplotlib.collections import PathCollection
+    _, ax = subplots()
+    plot_peak_params(peaks, colors=['red', 'blue', 'red'], labels='test', ax=ax)
+    assert len(ax.collections) == 2
+    for coll in ax.collections:
+        assert isinstance(coll, PathCollection)
+        assert len(np.unique(coll.get_facecolors(), axis=0)) == 1
+    assert ax.collections[0].get_label() == 'test'
+    assert ax.collections[1].get_label().startswith('_')
+
     # Test with multiple set of params
     plot_peak_params([peaks, peaks], file_path=TEST_PLOTS_PATH,
                      file_name='test_plot_peak_params.png')
@@ -33,3 +50,56 @@ def test_plot_peak_fits(skip_if_no_mpl):
     # Test with multiple set of params
     plot_peak_fits([peaks, peaks], file_path=TEST_PLOTS_PATH,
                    file_name='test_plot_peak_fits.png')
+
+def test_gauss_inplace():
+
+    freqs = np.arange(1, 40, 0.5)
+    peaks = np.array([[6, 1, 2], [10, 2, 1.5], [25, 1.5, 3]])
+
+    out = np.empty(shape=(len(peaks), len(freqs)))
+    _gauss_inplace(freqs, peaks[:, 0:1], peaks[:, 1:2], peaks[:, 2:3], out)
+
+    for ind, peak_params in enumerate(peaks):
+        assert np.allclose(out[ind, :], gaussian_function(freqs, *peak_params))
+
+def test_group_colors(skip_if_no_mpl):
+
+    assert _group_colors(None, 3) is None
+    assert _group_colors('red', 3) is None
+    assert _group_colors((1, 0, 0), 3) is None
+    assert _group_colors(np.array([0.1, 0.5, 0.9]), 3) is None
+
+    groups = _group_colors(['red', 'blue', 'red'], 3)
+    assert len(groups) == 2
+    for color, mask in groups:
+        assert color.shape == (1, 4)
+        assert mask.sum() in [1, 2]
+
+    assert _group_colors(['red', 'blue', 'green'], 3, max_groups=2) is None
+
+def test_get_default_colors(skip_if_no_mpl):
+
+    from matplotlib import rc_context, cycler
+
+    colors = _get_default_colors()
+    assert isinstance(colors, list)
+    assert _get_default_colors() is colors
+
+    # Check that a change to the color cycle is picked up
+    with rc_context({'axes.prop_cycle' : cycler(color=['red', 'blue'])}):
+        assert _get_default_colors() == ['red', 'blue']
+    assert _get_default_colors() == colors
+
+def test_gen_freqs_cached():
+
+    freqs = _gen_freqs_cached(3., 40., 0.5)
+    assert np.array_equal(freqs, gen_freqs([3, 40], 0.5))
+    assert not freqs.flags.writeable
+    assert _gen_freqs_cached(3., 40., 0.5) is freqs
+
+def test_broadcast_opt():
+
+    assert _broadcast_opt(None, 2) == [None, None]
+    assert _broadcast_opt('red', 2) == ['red', 'red']
+    assert _broadcast_opt(['red', 'blue'], 2) == ['red', 'blue']
+    assert _broadcast_opt(iter(['red', 'blue', 'green']), 2) == ['red', 'blue']